@@ -1,8 +1,54 @@
 #!/usr/bin/env python3
-import argparse, json, re, sys, textwrap
-import requests
+import argparse, atexit, hashlib, json, mmap, os, re, sys, textwrap, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-OLLAMA_URL = "http://localhost:11434/api/generate"
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# requests and sqlite3 are only needed for LLM calls and their cache, so they
+# are imported on first use (_session, _cache_open) to keep rule-only runs fast.
+requests = None
+sqlite3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON codec for Ollama traffic, facts and batch files: orjson when installed.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+    def _dumpb(obj) -> bytes:
+        return _dumps(obj).encode()
+
+OLLAMA_URL = "http://localhost:11434/api/chat"
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "jargon_shredder", "cache.db",
+)
+
+# One keep-alive session for all Ollama calls so the facts and rewrite
+# requests share a connection.
+_SESSION = None
+
+def _session():
+    global requests, _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.headers["Content-Type"] = "application/json"
+        _SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        atexit.register(_SESSION.close)
+    return _SESSION
 
 BUZZMAP = {
     r"\bfederated\b": "spread across different places",
@@ -51,6 +97,19 @@ BUZZMAP = {
     r"\bbrownfield\b": "built on existing systems",
 }
 
+FACT_FIELDS = ("numbers", "dates", "names", "protocols", "claims", "constraints")
+
+# Passed as Ollama's "format" (needs Ollama >= 0.5) so the facts pass decodes
+# straight into this shape.
+FACTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        k: {"type": "array", "items": {"type": "string"}}
+        for k in FACT_FIELDS
+    },
+    "required": list(FACT_FIELDS),
+}
+
 STYLE_PROMPTS = {
     "plain": "Rewrite in clear, plain English for a general audience. No jargon. Keep it brief but accurate.",
     "peasant": "Rewrite like you’re explaining to a medieval peasant, playful but still accurate. Short, simple sentences.",
@@ -58,28 +117,17 @@ STYLE_PROMPTS = {
     "exec": "Rewrite as crisp executive summary bullets. No fluff, no jargon, focus on outcome and why it matters.",
 }
 
-def buzz_sweep(text: str) -> str:
-    out = text
-    for pat, repl in BUZZMAP.items():
-        out = re.sub(pat, repl, out, flags=re.IGNORECASE)
-    out = re.sub(r"\s{2,}", " ", out)
-    return out.strip()
+# Prompt scaffolding is dedented once here; only the slots are filled per call.
+# The document goes in a system message shared by the facts and rewrite chats,
+# so it is sent once per request and Ollama can reuse the prefix between them.
+_DOCUMENT_TEMPLATE = textwrap.dedent("""
+    You are a jargon translator.
 
-def call_ollama(model: str, prompt: str, temperature: float = 0.2, timeout: int = 120) -> str:
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "options": {"temperature": temperature},
-        "stream": False,
-    }
-    r = requests.post(OLLAMA_URL, json=payload, timeout=timeout)
-    r.raise_for_status()
-    data = r.json()
-    return data.get("response", "").strip()
-
-def extract_facts(model: str, original: str) -> dict:
-    """Ask the model to extract key facts in JSON so we can force retention."""
-    sys_prompt = textwrap.dedent(f"""
+    ORIGINAL:
+    \"\"\"{original}\"\"\"
+    """).strip()
+
+_FACTS_PROMPT = textwrap.dedent("""
     Extract key facts from the ORIGINAL text as strict JSON with the following fields:
     - numbers: array of numeric facts (with units)
     - dates: array of date/time references
@@ -88,106 +136,562 @@ def extract_facts(model: str, original: str) -> dict:
     - claims: array of quoted or paraphrased product claims or promises
     - constraints: array of limits, caveats, SLAs, compliance notes
     Only output JSON. Do not explain.
-    ORIGINAL:
-    \"\"\"{original.strip()}\"\"\"
     """).strip()
-    try:
-        raw = call_ollama(model, sys_prompt, temperature=0.0)
-        start = raw.find("{")
-        end = raw.rfind("}")
-        if start != -1 and end != -1:
-            raw = raw[start:end+1]
-        data = json.loads(raw)
-        for k in ["numbers","dates","names","protocols","claims","constraints"]:
-            data.setdefault(k, [])
-        return data
-    except Exception:
-        return {"numbers":[],"dates":[],"names":[],"protocols":[],"claims":[],"constraints":[]}
-
-def build_prompt(style: str, original: str, preclean: str, facts: dict, maxlen: int, keep_terms=None, mode="faithful"):
-    instruct = STYLE_PROMPTS[style]
-    keep_terms = keep_terms or []
-    fact_str = json.dumps(facts, ensure_ascii=False)
-    keep_str = ", ".join(keep_terms) if keep_terms else "none"
 
-    if mode == "faithful":
-        policy = f"""
-        - This is a faithful simplification: DO NOT drop facts.
-        - You MUST preserve every number, date, proper noun, standard, protocol, and constraint shown in FACTS.
-        - If a fact is unclear, include it verbatim rather than omitting.
-        - Prefer short sentences. Avoid buzzwords.
-        - Target max length ~{maxlen} words while preserving all facts.
-        - Explicitly include these terms if present in the original: {keep_str}.
-        """
-    else:
-        policy = f"""
-        - This is a concise summary for non-experts.
-        - Prioritize outcomes and what it does for the user.
-        - Keep critical numbers/dates/constraints from FACTS.
-        - Target max length ~{maxlen} words.
-        - Explicitly include these terms if present in the original: {keep_str}.
-        """
-
-    return textwrap.dedent(f"""
-    You are a jargon translator.
+_POLICY_FAITHFUL = textwrap.dedent("""
+    - This is a faithful simplification: DO NOT drop facts.
+    - You MUST preserve every number, date, proper noun, standard, protocol, and constraint shown in FACTS.
+    - If a fact is unclear, include it verbatim rather than omitting.
+    - Prefer short sentences. Avoid buzzwords.
+    - Target max length ~{maxlen} words while preserving all facts.
+    - Explicitly include these terms if present in the original: {keep_str}.
+    """).strip()
 
+_POLICY_SUMMARY = textwrap.dedent("""
+    - This is a concise summary for non-experts.
+    - Prioritize outcomes and what it does for the user.
+    - Keep critical numbers/dates/constraints from FACTS.
+    - Target max length ~{maxlen} words.
+    - Explicitly include these terms if present in the original: {keep_str}.
+    """).strip()
+
+_PROMPT_TEMPLATE = textwrap.dedent("""
     {instruct}
 
     POLICY:
     {policy}
 
-    ORIGINAL:
-    \"\"\"{original.strip()}\"\"\"
-
     PRECLEAN (hints only):
-    \"\"\"{preclean.strip()}\"\"\"
+    \"\"\"{preclean}\"\"\"
 
     FACTS (must be preserved per POLICY):
     {fact_str}
     """).strip()
 
+# BUZZMAP is compiled once into a single alternation so buzz_sweep rewrites the
+# text in one pass, building one new string:
+#   (?P<s>...)  - plain words/phrases, dispatched by their lowercased match
+#   (?P<gN>...) - patterns with groups/classes, dispatched by group name
+_LITERAL_RE = re.compile(r"\\b([A-Za-z0-9 ]+)\\b")
+_REPL = {}
+_COMPLEX = []
+for _pat, _repl in BUZZMAP.items():
+    _m = _LITERAL_RE.fullmatch(_pat)
+    if _m:
+        _REPL[_m.group(1).lower()] = _repl
+    else:
+        _COMPLEX.append((_pat, _repl))
+
+_SWEEP_RE = re.compile(
+    r"\b(?P<s>" + "|".join(map(re.escape, sorted(_REPL, key=len, reverse=True))) + r")\b|"
+    + "|".join(f"(?P<g{i}>{pat})" for i, (pat, _) in enumerate(_COMPLEX)),
+    re.IGNORECASE,
+)
+_COMPLEX_REPL = {f"g{i}": repl for i, (_, repl) in enumerate(_COMPLEX)}
+
+def _sweep_repl(m):
+    if m.lastgroup == "s":
+        token = m.group("s")
+        repl = _REPL.get(token.lower())
+        if repl is None:
+            # IGNORECASE also folds non-ASCII letters ("ſ" for s, "İ" for i)
+            # that lower() maps elsewhere, so find the literal the regex matched.
+            repl = next(r for lit, r in _REPL.items() if re.fullmatch(re.escape(lit), token, re.IGNORECASE))
+        return repl
+    return _COMPLEX_REPL[m.lastgroup]
+
+# When python-hyperscan is installed, all of BUZZMAP goes into one block-mode
+# database and buzz_sweep splices replacements from a single scan. Word
+# boundaries and caseless matching there are ASCII-only, so buzz_sweep only
+# uses it for ASCII text; everything else takes the regex path above.
+_HS_DB = None
+_HS_REPL = [repl.encode() for repl in BUZZMAP.values()]
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[pat.encode() for pat in BUZZMAP],
+        ids=list(range(len(BUZZMAP))),
+        elements=len(BUZZMAP),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(BUZZMAP),
+    )
+
+def _hs_sweep(text: str):
+    data = text.encode()
+    matches = []
+
+    def on_match(idx, start, end, flags, context):
+        matches.append((start, -end, idx))
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+    # leftmost-longest, non-overlapping; ties go to the earlier BUZZMAP entry
+    matches.sort()
+    parts, pos = [], 0
+    for start, neg_end, idx in matches:
+        if start < pos:
+            continue
+        parts.append(data[pos:start])
+        parts.append(_HS_REPL[idx])
+        pos = -neg_end
+    parts.append(data[pos:])
+    return b"".join(parts).decode(), len(parts) // 2
+
+def read_text_file(path: str) -> str:
+    """Read a UTF-8 file as one stripped str.
+
+    Regular files are decoded straight out of a read-only mmap, so the only
+    full-size allocation is the returned string (plus one copy if CRLF or CR
+    line endings need translating); anything that can't be mapped (empty
+    files, pipes) is read normally.
+    """
+    with open(path, "rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            text = fh.read().decode("utf-8")
+        else:
+            with mm:
+                start, end = 0, len(mm)
+                while end and mm[end - 1] in b" \t\r\n\x0b\x0c":
+                    end -= 1
+                while start < end and mm[start] in b" \t\r\n\x0b\x0c":
+                    start += 1
+                with memoryview(mm)[start:end] as view:
+                    text = str(view, "utf-8")
+    # Binary reads skip universal newlines, so translate them as text mode would.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
+
+def buzz_sweep(text: str):
+    """Replace BUZZMAP terms and collapse all whitespace runs (newlines
+    included) to single spaces; returns (text, hits)."""
+    if _HS_DB is not None and text.isascii():
+        out, hits = _hs_sweep(text)
+    else:
+        out, hits = _SWEEP_RE.subn(_sweep_repl, text)
+    return " ".join(out.split()), hits
+
+def _chat_payload(model: str, prompt: str, temperature: float, fmt, system: str, stream: bool) -> dict:
+    messages = [{"role": "user", "content": prompt}]
+    if system is not None:
+        messages.insert(0, {"role": "system", "content": system})
+    payload = {
+        "model": model,
+        "messages": messages,
+        "options": {"temperature": temperature},
+        "stream": stream,
+    }
+    if fmt is not None:
+        payload["format"] = fmt
+    return payload
+
+def _reply_content(raw) -> str:
+    """Return the message content of one Ollama reply object; a reply that
+    isn't a JSON object (proxy error page, truncated stream) is raised as a
+    RequestException so callers handle it like any other failed request."""
+    try:
+        return _loads(raw).get("message", {}).get("content", "")
+    except (ValueError, AttributeError) as e:
+        raise requests.exceptions.RequestException(f"Unexpected reply from Ollama: {e}") from e
+
+def call_ollama(model: str, prompt: str, temperature: float = 0.2, timeout: int = 120, sink=None, fmt=None,
+                system: str = None) -> str:
+    """Run a single-turn chat and return the stripped response.
+
+    system, if given, is sent as the system message before prompt. fmt is
+    sent as Ollama's "format" ("json" or a JSON schema). With a sink, the
+    response is streamed and each chunk is passed to it as it arrives
+    (leading/trailing whitespace is held back to match the return value).
+    """
+    payload = _chat_payload(model, prompt, temperature, fmt, system, stream=sink is not None)
+    if sink is None:
+        r = _session().post(OLLAMA_URL, data=_dumpb(payload), timeout=timeout)
+        r.raise_for_status()
+        return _reply_content(r.content).strip()
+
+    chunks, pending, started = [], "", False
+    with _session().post(OLLAMA_URL, data=_dumpb(payload), stream=True, timeout=timeout) as r:
+        r.raise_for_status()
+        for line in r.iter_lines():
+            if not line:
+                continue
+            chunk = _reply_content(line)
+            chunks.append(chunk)
+            text = pending + chunk if started else chunk.lstrip()
+            body = text.rstrip()
+            pending = text[len(body):]
+            if body:
+                sink(body)
+                started = True
+    return "".join(chunks).strip()
+
+def _cache_key(*parts) -> str:
+    return hashlib.sha256("\0".join(map(str, parts)).encode()).hexdigest()
+
+# Fingerprints of everything that shapes a cached result besides the per-call
+# arguments, so editing a prompt, the facts schema or BUZZMAP (which feeds the
+# sweep in the rewrite prompt) retires the entries made with the old ones.
+_FACTS_VERSION = _cache_key(_DOCUMENT_TEMPLATE, _FACTS_PROMPT, json.dumps(FACTS_SCHEMA, sort_keys=True))
+_REWRITE_VERSION = _cache_key(_FACTS_VERSION, _PROMPT_TEMPLATE, _POLICY_FAITHFUL, _POLICY_SUMMARY,
+                              json.dumps(STYLE_PROMPTS, sort_keys=True), json.dumps(list(BUZZMAP.items())))
+
+def _cache_open():
+    global sqlite3
+    import sqlite3
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    db = sqlite3.connect(CACHE_PATH)
+    db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, created REAL)")
+    return db
+
+def _cache_get(key: str, ttl: float = None):
+    """Return the cached value for key, or None on a miss, expiry or cache error."""
+    try:
+        db = _cache_open()
+        try:
+            row = db.execute("SELECT value, created FROM cache WHERE key=?", (key,)).fetchone()
+            if row and ttl is not None and time.time() - row[1] > ttl:
+                with db:
+                    db.execute("DELETE FROM cache WHERE key=?", (key,))
+                return None
+        finally:
+            db.close()
+    except (OSError, sqlite3.Error):
+        return None
+    return row[0] if row else None
+
+def _cache_put(key: str, value: str) -> None:
+    try:
+        db = _cache_open()
+        try:
+            with db:
+                db.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, value, time.time()))
+        finally:
+            db.close()
+    except (OSError, sqlite3.Error):
+        pass
+
+def _first_json_object(s: str):
+    """Return the first balanced {...} region of s (ignoring braces inside
+    JSON strings), or None if there isn't one. Quotes outside the object are
+    plain prose and don't start a string."""
+    depth, in_str, esc, start = 0, False, False, None
+    for i, c in enumerate(s):
+        if in_str:
+            if esc:
+                esc = False
+            elif c == "\\":
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = depth > 0
+        elif c == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                return s[start:i+1]
+    return None
+
+def document_prompt(original: str) -> str:
+    return _DOCUMENT_TEMPLATE.format(original=original)
+
+def extract_facts(model: str, original: str, use_cache: bool = True, cache_ttl: float = None,
+                  system: str = None):
+    """Ask the model to extract key facts in JSON so we can force retention.
+
+    original is expected to be stripped already; system is its
+    document_prompt, if the caller has built one. Extraction runs at
+    temperature 0, so results are cached on disk by model and text; failed
+    extractions return None and are never cached.
+    """
+    key = _cache_key("facts", _FACTS_VERSION, model, original)
+    if use_cache:
+        hit = _cache_get(key, cache_ttl)
+        if hit is not None:
+            return _loads(hit)
+    if system is None:
+        system = document_prompt(original)
+    raw = call_ollama(model, _FACTS_PROMPT, temperature=0.0, fmt=FACTS_SCHEMA, system=system)
+    return _store_facts(key if use_cache else None, raw)
+
+def _empty_facts() -> dict:
+    return {k: [] for k in FACT_FIELDS}
+
+def _store_facts(key, raw: str):
+    """Parse a facts reply, caching it under key (if any) when it parses;
+    returns None if it doesn't."""
+    # The schema should make this the whole reply; scanning still guards
+    # against prose around it from servers that ignore "format".
+    candidate = _first_json_object(raw)
+    if candidate is None:
+        sys.stderr.write("[ERR] No JSON object in extracted facts\nContinuing without facts.\n")
+        return None
+    try:
+        data = _loads(candidate)
+    except json.JSONDecodeError as e:
+        sys.stderr.write(f"[ERR] Could not parse extracted facts: {e}\nContinuing without facts.\n")
+        return None
+    if key is not None:
+        _cache_put(key, _dumps(data))
+    return data
+
+def prompt_templates(style: str, mode: str):
+    """Return the (instruct, policy_template) pair build_prompt needs for a
+    style and mode, so callers can resolve it once per run."""
+    return STYLE_PROMPTS[style], _POLICY_FAITHFUL if mode == "faithful" else _POLICY_SUMMARY
+
+def build_prompt(instruct: str, policy_template: str, preclean: str, facts: dict, maxlen: int, keep_terms=None):
+    """instruct and policy_template come from prompt_templates()."""
+    keep_terms = keep_terms or []
+    fact_str = _dumps(facts)
+    keep_str = ", ".join(keep_terms) if keep_terms else "none"
+
+    policy = policy_template.format(maxlen=maxlen, keep_str=keep_str)
+    return _PROMPT_TEMPLATE.format(instruct=instruct, policy=policy, preclean=preclean, fact_str=fact_str)
+
+def _plan(original: str, args, keep_terms):
+    """Work out what shred can settle before calling the LLM.
+
+    Returns (result, preclean, facts_model, rewrite_key). result is the
+    final output when no LLM call is needed (--no-llm, short jargon-free
+    text, cached rewrite); preclean is None if the sweep hasn't run yet.
+    """
+    if args.no_llm:
+        out, _ = buzz_sweep(original)
+        return out, out, None, None
+
+    # Short text without any jargon hits has nothing for the model to simplify.
+    preclean = None
+    if not args.always_llm and len(original.split()) <= args.maxlen:
+        preclean, hits = buzz_sweep(original)
+        if hits == 0:
+            return original, preclean, None, None
+
+    # Only near-deterministic rewrites are cached; higher temperatures are
+    # expected to vary between runs.
+    facts_model = None if args.no_facts else args.facts_model or args.model
+    rewrite_key = None
+    if not args.no_cache and args.temperature <= 0.05:
+        rewrite_key = _cache_key("rewrite", _REWRITE_VERSION, args.model, args.style, args.mode, args.maxlen,
+                                 ",".join(keep_terms), args.temperature, facts_model, original)
+        cached = _cache_get(rewrite_key, args.cache_ttl)
+        if cached is not None:
+            return cached, preclean, facts_model, rewrite_key
+    return None, preclean, facts_model, rewrite_key
+
+def shred(original: str, args, keep_terms, templates, sink=None, fallback: bool = True) -> str:
+    """Run the full pipeline on one text and return the result.
+
+    args is the parsed CLI namespace and templates the prompt_templates()
+    pair for its style and mode. With a sink, everything that would be
+    printed (streamed rewrite, cached result or rule-based fallback) is also
+    passed to it as it becomes available. With fallback=False, a failed
+    Ollama request raises instead of degrading to fewer facts or the
+    rule-based output.
+    """
+    original = original.strip()
+    result, preclean, facts_model, rewrite_key = _plan(original, args, keep_terms)
+    if result is not None:
+        if sink:
+            sink(result)
+        return result
+
+    _session()  # imports requests before the worker thread or except clauses need it
+
+    # The facts request is network-bound, so the sweep runs while it is in flight.
+    system = document_prompt(original)
+    facts = None
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        fut_facts = None
+        if facts_model is not None:
+            fut_facts = ex.submit(extract_facts, facts_model, original,
+                                  use_cache=not args.no_cache, cache_ttl=args.cache_ttl, system=system)
+        if preclean is None:
+            preclean, _ = buzz_sweep(original)
+        if fut_facts is not None:
+            try:
+                facts = fut_facts.result()
+            except requests.exceptions.RequestException as e:
+                if not fallback:
+                    raise
+                sys.stderr.write(f"[ERR] Fact extraction failed: {e}\nContinuing without facts.\n")
+
+    instruct, policy_template = templates
+    prompt = build_prompt(instruct, policy_template, preclean,
+                          _empty_facts() if facts is None else facts, args.maxlen, keep_terms)
+
+    streamed = []
+    def emit(chunk):
+        streamed.append(chunk)
+        sink(chunk)
+
+    try:
+        out = call_ollama(args.model, prompt, temperature=args.temperature, sink=emit if sink else None,
+                          system=system)
+    except requests.exceptions.RequestException as e:
+        if not fallback:
+            raise
+        sys.stderr.write(f"[ERR] Ollama request failed: {e}\nFalling back to rule-based output.\n")
+        if sink:
+            sink("\n" + preclean if streamed else preclean)
+        return preclean
+
+    # Empty replies and rewrites made without the facts they were meant to
+    # keep are not cached, so the next run retries them.
+    if rewrite_key is not None and out and (facts is not None or facts_model is None):
+        _cache_put(rewrite_key, out)
+    return out
+
+BATCH_FSYNC_EVERY = 16
+
+def _ordered_writer(out, todo):
+    """Return add(i, result), which writes results to out in todo order.
+    A result of None marks a failed document and is skipped."""
+    results = {}
+    nxt = 0
+
+    def add(i, result):
+        nonlocal nxt
+        results[i] = result
+        while nxt in results:
+            result = results.pop(nxt)
+            if result is not None:
+                out.write(_dumps({"id": todo[nxt]["id"], "output": result}) + "\n")
+            nxt += 1
+            if nxt % BATCH_FSYNC_EVERY == 0:
+                out.flush()
+                os.fsync(out.fileno())
+    return add
+
+def _run_batch_threads(args, keep_terms, templates, todo, add) -> int:
+    """Shred todo on a thread pool, passing results to add; returns the
+    number of documents whose Ollama requests failed."""
+    # One pooled connection per worker on the shared session.
+    _session().mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=max(args.concurrency, 4)))
+    failed = 0
+    with ThreadPoolExecutor(max_workers=args.concurrency) as ex:
+        futs = {ex.submit(shred, d["text"], args, keep_terms, templates, fallback=False): i for i, d in enumerate(todo)}
+        for fut in as_completed(futs):
+            i = futs[fut]
+            try:
+                result = fut.result()
+            except requests.exceptions.RequestException as e:
+                sys.stderr.write(f"[ERR] Document {todo[i]['id']!r} failed: {e}\n")
+                result = None
+                failed += 1
+            add(i, result)
+    return failed
+
+def _batch_doc(line: str) -> dict:
+    """Parse one batch line into its {"id", "text"} object, raising
+    ValueError if it isn't one."""
+    doc = _loads(line)
+    if not isinstance(doc, dict) or "id" not in doc:
+        raise ValueError('expected an object with "id" and "text"')
+    if isinstance(doc["id"], (list, dict)):
+        raise ValueError('"id" must be a string or number')
+    if not isinstance(doc.get("text"), str):
+        raise ValueError('"text" must be a string')
+    return doc
+
+def run_batch(args, keep_terms, templates) -> None:
+    """Shred every {"id", "text"} line of args.batch into args.out.
+
+    Results are appended in input order as {"id", "output"} lines and synced
+    to disk periodically; ids already present in args.out are skipped, so an
+    interrupted run can simply be restarted. Documents whose Ollama requests
+    fail are left out rather than written with the rule-based fallback, so a
+    rerun retries them; malformed input lines are reported and skipped.
+    Documents are shredded on a thread pool of args.concurrency workers
+    sharing one session.
+    """
+    done = set()
+    needs_newline = False
+    if os.path.exists(args.out):
+        with open(args.out, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    done.add(_loads(line)["id"])
+                except (ValueError, KeyError, TypeError):
+                    pass  # torn final line from an interrupted run
+                needs_newline = not line.endswith("\n")
+
+    docs, invalid = [], 0
+    with open(args.batch, "r", encoding="utf-8") as fh:
+        for n, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                docs.append(_batch_doc(line))
+            except ValueError as e:
+                sys.stderr.write(f"[ERR] Skipping line {n} of {args.batch}: {e}\n")
+                invalid += 1
+    todo = [d for d in docs if d["id"] not in done]
+
+    with open(args.out, "a", encoding="utf-8") as out:
+        if needs_newline:
+            out.write("\n")
+        failed = _run_batch_threads(args, keep_terms, templates, todo, _ordered_writer(out, todo))
+        out.flush()
+        os.fsync(out.fileno())
+
+    sys.stderr.write(f"[OK] {len(todo) - failed} documents written to {args.out} ({len(done)} already done)\n")
+    if failed:
+        sys.stderr.write(f"[ERR] {failed} documents failed\nRe-run the same command to retry them.\n")
+    if invalid:
+        sys.stderr.write(f"[ERR] {invalid} malformed lines in {args.batch} were skipped\n")
+
 def main():
     ap = argparse.ArgumentParser(description="BullshitShredder — turn buzzword soup into human words without losing facts.")
     ap.add_argument("-m", "--model", default="gemma:2b", help="Ollama model name (default: gemma:2b)")
+    ap.add_argument("--facts-model", default=os.environ.get("JS_FACTS_MODEL"),
+                    help="Smaller Ollama model for the fact extraction pass, e.g. qwen2.5:0.5b-instruct-q4_0 "
+                         "(default: $JS_FACTS_MODEL, else --model)")
     ap.add_argument("-s", "--style", default="plain", choices=list(STYLE_PROMPTS.keys()), help="Output style")
     ap.add_argument("--mode", choices=["faithful","summary"], default="faithful", help="faithful = keep all facts; summary = concise overview")
     ap.add_argument("--maxlen", type=int, default=120, help="Target word cap for LLM rewrite")
     ap.add_argument("--keep", default="", help="Comma-separated terms that must appear in output (e.g., 'HIPAA, MQTT, CE')")
     ap.add_argument("--no-llm", action="store_true", help="Only run rule-based sweep (no LLM)")
+    ap.add_argument("--always-llm", action="store_true", help="Run the LLM even on short text with no jargon hits")
     ap.add_argument("--no-facts", action="store_true", help="Skip facts extraction pass (single-pass rewrite)")
     ap.add_argument("-f", "--file", help="Read input text from file (otherwise stdin/arg)")
     ap.add_argument("--temperature", type=float, default=0.2, help="LLM temperature")
+    ap.add_argument("--no-cache", action="store_true", help="Don't read or write the on-disk LLM result cache")
+    ap.add_argument("--cache-ttl", type=float, default=None, help="Ignore cached results older than this many seconds")
+    ap.add_argument("--batch", help="Process a JSONL file of {\"id\", \"text\"} objects (requires --out)")
+    ap.add_argument("--out", help="JSONL file batch results are appended to; ids already in it are skipped")
+    ap.add_argument("--concurrency", type=int, default=2, help="Documents processed at once in batch mode (default: 2)")
     ap.add_argument("text", nargs="*", help="Input text (if no -f, read from here or stdin)")
     args = ap.parse_args()
 
+    # Resolved once so per-document prompt building needs no lookups.
+    templates = prompt_templates(args.style, args.mode)
+    keep_terms = [t.strip() for t in args.keep.split(",") if t.strip()]
+
+    if args.batch:
+        if not args.out:
+            ap.error("--batch requires --out")
+        if args.concurrency < 1:
+            ap.error("--concurrency must be at least 1")
+        run_batch(args, keep_terms, templates)
+        return
+
     if args.file:
-        with open(args.file, "r", encoding="utf-8") as fh:
-            original = fh.read()
+        original = read_text_file(args.file)
     elif args.text:
         original = " ".join(args.text)
     else:
         original = sys.stdin.read()
 
-    preclean = buzz_sweep(original)
-
-    if args.no_llm:
-        print(preclean)
-        return
-
-    facts = {"numbers":[],"dates":[],"names":[],"protocols":[],"claims":[],"constraints":[]}
-    if not args.no_facts:
-        facts = extract_facts(args.model, original)
-
-    keep_terms = [t.strip() for t in args.keep.split(",") if t.strip()]
-    prompt = build_prompt(args.style, original, preclean, facts, args.maxlen, keep_terms, args.mode)
-
-    try:
-        out = call_ollama(args.model, prompt, temperature=args.temperature)
-    except requests.exceptions.RequestException as e:
-        sys.stderr.write(f"[ERR] Ollama request failed: {e}\nFalling back to rule-based output.\n")
-        out = preclean
+    def write(chunk):
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
 
-    print(out)
+    shred(original, args, keep_terms, templates, sink=write)
+    print()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,70 @@
+import pytest
+
+import jargon_shredder as js
+
+
+def test_buzz_sweep_non_ascii_case_folds(monkeypatch):
+    monkeypatch.setattr(js, "_HS_DB", None)
+    assert js.buzz_sweep("ſerverless") == ("you don't manage the servers", 1)
+    assert js.buzz_sweep("İoT latency") == ("internet-connected devices delay", 2)
+
+@pytest.mark.skipif(js._HS_DB is None, reason="hyperscan not installed")
+def test_buzz_sweep_backends_agree(monkeypatch):
+    texts = ["We leverage serverless latency at scale", "élatency", "ſerverless", "İoT latency"]
+    with_hs = [js.buzz_sweep(t) for t in texts]
+    monkeypatch.setattr(js, "_HS_DB", None)
+    assert with_hs == [js.buzz_sweep(t) for t in texts]
+
+def test_rewrite_not_cached_without_facts(monkeypatch, tmp_path):
+    monkeypatch.setattr(js, "CACHE_PATH", str(tmp_path / "cache.db"))
+    monkeypatch.setattr(js, "extract_facts", lambda *a, **kw: None)
+    monkeypatch.setattr(js, "call_ollama", lambda *a, **kw: "rewrite")
+    args = js.argparse.Namespace(
+        no_llm=False, always_llm=True, maxlen=120, no_facts=False, facts_model=None, model="m",
+        no_cache=False, temperature=0.0, cache_ttl=None, style="plain", mode="faithful")
+    templates = js.prompt_templates(args.style, args.mode)
+    assert js.shred("We leverage serverless", args, [], templates) == "rewrite"
+    assert js._plan("We leverage serverless", args, [])[0] is None
+    args.no_facts = True
+    assert js.shred("We leverage serverless", args, [], templates) == "rewrite"
+    assert js._plan("We leverage serverless", args, [])[0] == "rewrite"
+    monkeypatch.setattr(js, "call_ollama", lambda *a, **kw: "")
+    assert js.shred("We leverage serverless latency", args, [], templates) == ""
+    assert js._plan("We leverage serverless latency", args, [])[0] is None
+
+def test_read_text_file_translates_newlines(tmp_path):
+    path = tmp_path / "in.txt"
+    path.write_bytes(b"We leverage\r\nserverless\rlatency\r\n")
+    assert js.read_text_file(str(path)) == "We leverage\nserverless\nlatency"
+
+def test_first_json_object_in_prose():
+    assert js._first_json_object('The 6" screen facts: {"numbers": ["6 in"]}') == '{"numbers": ["6 in"]}'
+    assert js._first_json_object('He said "hi. {"numbers": ["1"]}') == '{"numbers": ["1"]}'
+    assert js._first_json_object('Facts: {"names": ["Acme }"]} done') == '{"names": ["Acme }"]}'
+    assert js._first_json_object('{"a": ["1"]} {"b": ["2"]}') == '{"a": ["1"]}'
+    assert js._first_json_object('no facts here') is None
+
+def test_run_batch_resumes_failed_in_order(monkeypatch, tmp_path):
+    import requests, time
+    batch, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    batch.write_text('{"id": 1, "text": "one"}\n'
+                     'not json\n'
+                     '{"id": 2, "text": null}\n'
+                     '{"id": 3, "text": "fail"}\n'
+                     '{"id": 4, "text": "four"}\n', encoding="utf-8")
+    args = js.argparse.Namespace(batch=str(batch), out=str(out), concurrency=3)
+    flaky = {"fail"}
+
+    def fake_shred(text, args, keep_terms, templates, fallback=True):
+        time.sleep(0.05 if text == "one" else 0)  # finish out of order
+        if text in flaky:
+            raise requests.exceptions.ConnectionError("down")
+        return text.upper()
+
+    monkeypatch.setattr(js, "shred", fake_shred)
+    js.run_batch(args, [], js.prompt_templates("plain", "faithful"))
+    assert [js._loads(l)["id"] for l in out.read_text().splitlines()] == [1, 4]
+    flaky.clear()
+    js.run_batch(args, [], js.prompt_templates("plain", "faithful"))
+    assert [js._loads(l) for l in out.read_text().splitlines()] == [
+        {"id": 1, "output": "ONE"}, {"id": 4, "output": "FOUR"}, {"id": 3, "output": "FAIL"}]